@@ -5,17 +5,67 @@ Improved DNA double-helix viewer with zoomed segment display and striped rungs.
 Run with: python dna_visualization_zoom.py
 """
 import tkinter as tk
+import tkinter.font as tkfont
 import math
-import random
-from typing import List, Tuple
+from typing import List
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # optional: positions fall back to plain NumPy
+    numba = None
 
 COMPLEMENT = {'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C'}
+COMPLEMENT_TABLE = str.maketrans(COMPLEMENT)
 
 # Colors
 BACKBONE_LEFT = '#5CA0D9'
 BACKBONE_RIGHT = '#2A6F97'
 STRIPE_COLORS = ['#ff9800', '#1976d2']  # orange, blue (alternating stripes)
 BASE_COLORS = {'A': '#2ca02c', 'C': '#17becf', 'T': '#d62728', 'G': '#9467bd'}
+BASE_CODES = np.frombuffer(b'ACGT', dtype=np.uint8)  # random index 0..3 -> ASCII base
+
+# the canvas scrolls over y in [-SCROLL_EXTENT, SCROLL_EXTENT], far beyond any helix
+SCROLL_EXTENT = 100_000
+
+
+def _positions_vectorized(n, twist, amplitude, step_height, center_x, top_margin, out_xl, out_xr, out_y):
+    steps = np.arange(n, dtype=np.float64)
+    theta = steps * twist
+    # right strand is half a turn behind: cos(theta + pi) == -cos(theta)
+    x_off = amplitude * np.cos(theta)
+    out_xl[:] = center_x + x_off
+    out_xr[:] = center_x - x_off
+    out_y[:] = top_margin + steps * step_height + np.sin(theta) * (step_height * 0.25)
+
+
+def _positions_loop(n, twist, amplitude, step_height, center_x, top_margin, out_xl, out_xr, out_y):
+    wobble = step_height * 0.25
+    for i in range(n):
+        theta = i * twist
+        x_off = amplitude * math.cos(theta)
+        out_xl[i] = center_x + x_off
+        out_xr[i] = center_x - x_off
+        out_y[i] = top_margin + i * step_height + math.sin(theta) * wobble
+
+
+# fill out_xl/out_xr/out_y (float32, length n) with the backbone positions of every step;
+# compiled eagerly when numba is installed so slider/preset recomputes stay cheap
+if numba is not None:
+    _compute_positions = numba.njit(
+        "void(i8,f8,f8,f8,f8,f8,f4[:],f4[:],f4[:])", cache=True, fastmath=True
+    )(_positions_loop)
+else:
+    _compute_positions = _positions_vectorized
+
+
+def _interleave(xs: np.ndarray, ys: np.ndarray) -> List[float]:
+    """Flatten matching x and y arrays into the [x0, y0, x1, y1, ...] list Tk expects."""
+    points = np.empty(2 * len(xs), dtype=np.float32)
+    points[0::2] = xs
+    points[1::2] = ys
+    return points.tolist()
 
 
 class DNA:
@@ -32,6 +82,7 @@ class DNA:
         stripe_count: int = 10,
         center_x: int = None,
         top_margin: int = 20,
+        draw_center_accent: bool = False,
     ):
         self.canvas = canvas
         self.total_steps = total_steps
@@ -43,13 +94,72 @@ class DNA:
         self.rung_thickness = rung_thickness
         self.stripe_count = stripe_count
         self.top_margin = top_margin
+        # thin light line through the middle of each rung; off by default. With an even
+        # stripe_count (as in the default and the preset) it falls between two stripes and
+        # is visible, so turning it off does change the rendered rungs.
+        self.draw_center_accent = draw_center_accent
 
         self.width = int(self.canvas['width'])
         self.height = int(self.canvas['height'])
         self.center_x = center_x if center_x is not None else self.width // 2
+        self._accent_color = self._lighten('#333333', 0.85)
+        # named font object so Tk resolves it once instead of parsing a font tuple per label
+        self._label_font = tkfont.Font(root=self.canvas, family="Helvetica", size=12, weight="bold")
+
+        # backbone positions stored per axis (left x, right x, shared y), one entry per step;
+        # allocated once and refilled in place by compute_positions
+        self.pos_xl = np.empty(self.total_steps, dtype=np.float32)
+        self.pos_xr = np.empty(self.total_steps, dtype=np.float32)
+        self.pos_y = np.empty(self.total_steps, dtype=np.float32)
+
+        # pre-rendered striped rung images keyed by rung width in pixels, plus the stripe
+        # layout they are drawn from; both are rebuilt when (stripe_count, rung_thickness) changes
+        self._stripe_images = {}
+        self._stripe_key = None
+        self._stripe_width = 1
+        self._stripe_y_offsets = np.empty(0, dtype=np.float32)
+
+        # canvas item ids reused across draws. Backbone pieces and circles exist for every
+        # step (built once per geometry, shown/hidden per view); caps are the two end pieces
+        # of each strand, reshaped per view. Rung parts exist for the visible slots only and
+        # the _drawn_* lists remember what each slot shows so unchanged ones are skipped.
+        self._ids = {
+            'pieces_left': [],
+            'pieces_right': [],
+            'caps_left': [],
+            'caps_right': [],
+            'circles_left': [],
+            'circles_right': [],
+            'stripes': [],
+            'labels_left': [],
+            'labels_right': [],
+        }
+        self._drawn_images: List[tk.PhotoImage] = []
+        self._drawn_bases: List[str] = []
+        # scratch buffers for flattening coordinates before handing them to Tk: backbone
+        # pieces (fixed size) and visible rungs (resized with the rung slots)
+        self._piece_coords = np.empty((max(0, self.total_steps - 2), 6), dtype=np.float32)
+        self._rung_coords = np.empty((0, 6), dtype=np.float32)
+        self._positions_key = None  # _position_params() the pos_* arrays were computed with
+        self._static_key = None  # _static_items_key() the static items were built with
+        self._shown = None  # (start, end) of the steps whose static items are visible
+
+        # views are centered by scrolling the canvas (yview) over a fixed region rather than
+        # by shifting item coordinates, so the region and the guide are set up only once
+        self.canvas.config(scrollregion=(0, -SCROLL_EXTENT, self.width, SCROLL_EXTENT))
+        # draw a central vertical guide (optional, like in your second image)
+        self.canvas.create_line(
+            self.center_x, -SCROLL_EXTENT, self.center_x, SCROLL_EXTENT,
+            fill='#cfcfcf', dash=(3, 6), tags=('guide',),
+        )
 
-        self.positions: List[Tuple[Tuple[float, float], Tuple[float, float]]] = []
-        self.sequence: List[str] = []
+        # redraw requests are coalesced into one draw() per idle cycle
+        self._dirty = False
+        self._draw_pending = False
+        # everything the last drawn frame depended on; draw() returns early while it matches
+        self._last_key = None
+        self._rng = np.random.default_rng()
+        self.sequence: str = ""
         self.generate_sequence()
         self.compute_positions()
 
@@ -62,22 +172,41 @@ class DNA:
             seq = seq.upper().strip()
             if len(seq) != self.total_steps:
                 raise ValueError("Provided sequence length must equal total_steps")
-            self.sequence = list(seq)
+            if not set(seq) <= COMPLEMENT.keys():
+                raise ValueError("Provided sequence may only contain A, C, G and T")
+            self.sequence = seq
         else:
-            choices = ['A', 'C', 'G', 'T']
-            self.sequence = [random.choice(choices) for _ in range(self.total_steps)]
+            idx = self._rng.integers(0, 4, size=self.total_steps, dtype=np.uint8)
+            self.sequence = BASE_CODES[idx].tobytes().decode('ascii')
+        # complement strand as a string too, so drawing reads both bases by index
+        self._comp_str = self.sequence.translate(COMPLEMENT_TABLE)
+        self._last_key = None
 
     def compute_positions(self):
-        self.positions = []
-        for i in range(self.total_steps):
-            theta = i * self.twist
-            x_off_left = self.amplitude * math.cos(theta)
-            x_off_right = self.amplitude * math.cos(theta + math.pi)
-            z_wobble = math.sin(theta) * (self.step_height * 0.25)
-            y = self.top_margin + i * self.step_height + z_wobble
-            x_left = self.center_x + x_off_left
-            x_right = self.center_x + x_off_right
-            self.positions.append(((x_left, y), (x_right, y)))
+        _compute_positions(
+            self.total_steps,
+            float(self.twist),
+            float(self.amplitude),
+            float(self.step_height),
+            float(self.center_x),
+            float(self.top_margin),
+            self.pos_xl,
+            self.pos_xr,
+            self.pos_y,
+        )
+        # the prebuilt items follow this key, so they are only rebuilt when the positions
+        # really changed (not on randomize) and never for parameters not applied yet
+        self._positions_key = self._position_params()
+        self._last_key = None
+        self._rebuild_static()
+
+    def _position_params(self):
+        """Parameters compute_positions derives the backbone positions from."""
+        return (self.amplitude, self.step_height, self.twist, self.center_x, self.top_margin)
+
+    def _static_items_key(self):
+        """What the prebuilt backbones and circles depend on: computed positions plus item sizes."""
+        return (self._positions_key, self.circle_r, self.backbone_width)
 
     def _lighten(self, hexcolor: str, amount: float) -> str:
         hexcolor = hexcolor.lstrip('#')
@@ -89,155 +218,272 @@ class DNA:
         b = int(b + (255 - b) * amount)
         return f'#{r:02x}{g:02x}{b:02x}'
 
-    def draw_backbones(self, view_positions: List[Tuple[Tuple[float, float], Tuple[float, float]]]):
-        # left points and right points lists (flatten)
-        left_points = []
-        right_points = []
-        for (l, r) in view_positions:
-            left_points.extend(l)
-            right_points.extend(r)
-
+    def _rebuild_static(self):
+        """Recompute the stripe layout shared by all rungs; drops cached rung images if it changed."""
+        key = (self.stripe_count, self.rung_thickness, self.draw_center_accent)
+        if key == self._stripe_key:
+            return
+        self._stripe_key = key
+        stripe_spacing = max(1.0, self.rung_thickness / max(1, self.stripe_count))
+        self._stripe_width = max(1, int(stripe_spacing * 0.9))
+        # stripe offsets relative to the rung center: top -> bottom
+        t = np.arange(self.stripe_count, dtype=np.float32) / max(1, (self.stripe_count - 1))
+        self._stripe_y_offsets = (t - 0.5) * self.rung_thickness
+        self._stripe_images = {}
+
+    def _stripe_image(self, width: int) -> tk.PhotoImage:
+        """Return the striped rung pattern (plus optional center accent) as an image `width` pixels wide (cached).
+
+        Expects the stripe layout to be current (see _rebuild_static).
+        """
+        image = self._stripe_images.get(width)
+        if image is None:
+            stripe_width = self._stripe_width
+            height = int(self.rung_thickness) + stripe_width
+            image = tk.PhotoImage(master=self.canvas, width=width, height=height)
+            # unwritten pixels stay transparent, so only the stripe rows are painted
+            rows = np.rint(self._stripe_y_offsets + self.rung_thickness / 2).astype(int).tolist()
+            for s, row in enumerate(rows):
+                # alternating stripe color (two-color pattern like the sample)
+                color = STRIPE_COLORS[s % len(STRIPE_COLORS)]
+                image.put(color, to=(0, row, width, row + stripe_width))
+            if self.draw_center_accent:
+                # center accent thin line (light), on the row the image is centered on
+                accent_row = (height - 1) // 2
+                image.put(self._accent_color, to=(0, accent_row, width, accent_row + 1))
+            self._stripe_images[width] = image
+        return image
+
+    def _restack(self):
+        """Restore the drawing order: backbones, rungs, circles, labels, guide."""
+        self.canvas.tag_lower('backbone')
+        self.canvas.tag_raise('circle')
+        self.canvas.tag_raise('label')
+        self.canvas.tag_raise('guide')
+
+    def draw_backbones(self):
+        """Build both backbones for the whole helix, one hidden smooth piece per step.
+
+        Piece k is the part of the strand's spline around step k (from the midpoint with
+        step k-1 to the midpoint with step k+1), which is exactly how Tk smooths a longer
+        line, so showing consecutive pieces draws the same curve as one line would.
+        The two end pieces of the visible strand are separate caps set per view.
+        """
+        ids = self._ids
+        self.canvas.delete('backbone')
+        ys = self.pos_y
+        mid_y = (ys[:-1] + ys[1:]) / 2
         # Draw right (darker) then left (lighter) so left appears on top
-        self.canvas.create_line(
-            *right_points,
-            fill=BACKBONE_RIGHT,
-            width=self.backbone_width,
-            smooth=True,
-            splinesteps=48,
-            capstyle=tk.ROUND,
-            joinstyle=tk.ROUND,
-        )
-        self.canvas.create_line(
-            *left_points,
-            fill=BACKBONE_LEFT,
-            width=self.backbone_width,
-            smooth=True,
-            splinesteps=48,
-            capstyle=tk.ROUND,
-            joinstyle=tk.ROUND,
-        )
+        for side, xs, color in (('right', self.pos_xr, BACKBONE_RIGHT), ('left', self.pos_xl, BACKBONE_LEFT)):
+            options = dict(
+                fill=color,
+                width=self.backbone_width,
+                smooth=True,
+                capstyle=tk.ROUND,
+                joinstyle=tk.ROUND,
+                state=tk.HIDDEN,
+                tags=('backbone',),
+            )
+            # row k-1 holds piece k: midpoint with k-1, point k, midpoint with k+1
+            mid_x = (xs[:-1] + xs[1:]) / 2
+            coords = self._piece_coords
+            coords[:, 0] = mid_x[:-1]
+            coords[:, 1] = mid_y[:-1]
+            coords[:, 2] = xs[1:-1]
+            coords[:, 3] = ys[1:-1]
+            coords[:, 4] = mid_x[1:]
+            coords[:, 5] = mid_y[1:]
+            pieces = [None] * self.total_steps
+            for k, piece in enumerate(coords.tolist(), start=1):
+                pieces[k] = self.canvas.create_line(*piece, **options)
+            ids['pieces_' + side] = pieces
+            ids['caps_' + side] = [self.canvas.create_line(0, 0, 0, 0, **options) for _ in range(2)]
+
+    def _draw_circles(self):
+        """Build the backbone circles for every step (hidden until their step is in view)."""
+        ids = self._ids
+        self.canvas.delete('circle')
+        r = self.circle_r
+        ys = self.pos_y.tolist()
+        for side, xs in (('left', self.pos_xl.tolist()), ('right', self.pos_xr.tolist())):
+            # backbone circles at the backbone points (larger for clarity)
+            ids['circles_' + side] = [
+                self.canvas.create_oval(
+                    x - r, y - r, x + r, y + r,
+                    fill='#FFA726', outline='#CC7600', state=tk.HIDDEN, tags=('circle',),
+                )
+                for x, y in zip(xs, ys)
+            ]
+
+    def _build_static_items(self):
+        """(Re)build the items that cover the whole helix."""
+        self.draw_backbones()
+        self._draw_circles()
+        self._restack()
+        self._static_key = self._static_items_key()
+        self._shown = None  # fresh items start hidden
+
+    def _show_backbones(self, start: int, end: int):
+        """Show the backbone pieces and circles of steps start..end-1 and hide the rest."""
+        ids = self._ids
+        # only the previously shown range can be visible, so hide just that (and the caps)
+        if self._shown is not None:
+            prev_start, prev_end = self._shown
+            for k in range(prev_start, prev_end):
+                self.canvas.itemconfig(ids['circles_left'][k], state=tk.HIDDEN)
+                self.canvas.itemconfig(ids['circles_right'][k], state=tk.HIDDEN)
+            for k in range(prev_start + 2, prev_end - 2):
+                self.canvas.itemconfig(ids['pieces_right'][k], state=tk.HIDDEN)
+                self.canvas.itemconfig(ids['pieces_left'][k], state=tk.HIDDEN)
+            for cap in ids['caps_right'] + ids['caps_left']:
+                self.canvas.itemconfig(cap, state=tk.HIDDEN)
+        self._shown = (start, end)
+        for k in range(start, end):
+            self.canvas.itemconfig(ids['circles_left'][k], state=tk.NORMAL)
+            self.canvas.itemconfig(ids['circles_right'][k], state=tk.NORMAL)
+        count = end - start
+        if count < 2:
+            return
+        # spline subdivisions per piece: short views have few, small pieces on screen,
+        # so beyond a handful of steps the extra sampling is not visible
+        shown = dict(state=tk.NORMAL, splinesteps=max(6, min(48, 3 * count)))
+        for k in range(start + 2, end - 2):
+            self.canvas.itemconfig(ids['pieces_right'][k], **shown)
+            self.canvas.itemconfig(ids['pieces_left'][k], **shown)
+
+        # the strand starts and ends exactly on the first/last visible step
+        ys = self.pos_y[start:end]
+        for side, xs in (('right', self.pos_xr[start:end]), ('left', self.pos_xl[start:end])):
+            head, tail = ids['caps_' + side]
+            if count <= 3:
+                # short views are a single straight line or a single spline piece
+                self.canvas.coords(head, *_interleave(xs, ys))
+                self.canvas.itemconfig(head, **shown)
+                continue
+            x, y = xs.tolist(), ys.tolist()
+            self.canvas.coords(head, x[0], y[0], x[1], y[1], (x[1] + x[2]) / 2, (y[1] + y[2]) / 2)
+            self.canvas.coords(tail, (x[-3] + x[-2]) / 2, (y[-3] + y[-2]) / 2, x[-2], y[-2], x[-1], y[-1])
+            self.canvas.itemconfig(head, **shown)
+            self.canvas.itemconfig(tail, **shown)
+
+    def _resize_rung_items(self, count: int):
+        """Create or delete rung items so exactly `count` rung slots exist."""
+        ids = self._ids
+        if len(ids['stripes']) == count:
+            return
+        self._rung_coords = np.empty((count, 6), dtype=np.float32)
+        while len(ids['stripes']) > count:
+            for part in ('stripes', 'labels_left', 'labels_right'):
+                self.canvas.delete(ids[part].pop())
+            self._drawn_images.pop()
+            self._drawn_bases.pop()
+        while len(ids['stripes']) < count:
+            ids['stripes'].append(self.canvas.create_image(0, 0, tags=('rung',)))
+            # base letters near the center (stacked vertically to be readable)
+            ids['labels_left'].append(self.canvas.create_text(0, 0, font=self._label_font, tags=('label',)))
+            ids['labels_right'].append(self.canvas.create_text(0, 0, font=self._label_font, tags=('label',)))
+            self._drawn_images.append(None)
+            self._drawn_bases.append(None)
+        # new rungs are created on top; put circles, labels and guide back above them
+        self._restack()
 
     def draw_striped_rungs_and_bases(self, view_slice: slice):
         """Draw rungs as stacked thin horizontal stripes to give the layered look."""
         start = view_slice.start or 0
         stop = view_slice.stop or self.total_steps
-        step_indices = range(start, stop)
-        stripe_spacing = max(1.0, self.rung_thickness / max(1, self.stripe_count))
-        for i in step_indices:
-            ((xl, yl), (xr, yr)) = self.positions[i]
-            left_base = self.sequence[i]
-            right_base = COMPLEMENT[left_base]
-
-            # compute stripe stack centered at y
-            mid_y = (yl + yr) / 2.0
-            half_span = (self.rung_thickness / 2.0)
-            for s in range(self.stripe_count):
-                # compute relative offset: top -> bottom
-                t = s / max(1, (self.stripe_count - 1))
-                offset = (t - 0.5) * self.rung_thickness
-                y_line = mid_y + offset
-
-                # alternating stripe color (two-color pattern like the sample)
-                color = STRIPE_COLORS[s % len(STRIPE_COLORS)]
-                # draw line (thin)
-                self.canvas.create_line(
-                    xl, y_line, xr, y_line,
-                    fill=color,
-                    width=max(1, int(stripe_spacing * 0.9)),
-                    capstyle=tk.ROUND,
-                )
+        self._resize_rung_items(stop - start)
+        # stripe geometry may have changed since the last frame; checked once, not per rung
+        self._rebuild_static()
+        ids = self._ids
+        label_offset_x = 10
+        xl = self.pos_xl[start:stop]
+        xr = self.pos_xr[start:stop]
+        # both backbone points share y, so the stripe stack is centered on it
+        mid_y = self.pos_y[start:stop]
+        center_x = (xl + xr) / 2
+
+        # all rung coordinates in one array, converted for Tk once:
+        # row k = stripe image (x, y), left label (x, y), right label (x, y)
+        coords = self._rung_coords
+        coords[:, 0] = center_x
+        coords[:, 2] = center_x - label_offset_x
+        coords[:, 4] = center_x + label_offset_x
+        coords[:, 1::2] = mid_y[:, None]
+        widths = np.maximum(1, np.rint(np.abs(xr - xl))).astype(int).tolist()
+
+        for k, (i, row, width) in enumerate(zip(range(start, stop), coords.tolist(), widths)):
+            # stripes and accent are one cached image per rung width instead of one line each
+            self.canvas.coords(ids['stripes'][k], row[0], row[1])
+            image = self._stripe_image(width)
+            if image is not self._drawn_images[k]:
+                self.canvas.itemconfig(ids['stripes'][k], image=image)
+                self._drawn_images[k] = image
+
+            self.canvas.coords(ids['labels_left'][k], row[2], row[3])
+            self.canvas.coords(ids['labels_right'][k], row[4], row[5])
 
-            # draw center accent thin line (light)
-            self.canvas.create_line(
-                xl, mid_y, xr, mid_y,
-                fill=self._lighten('#333333', 0.85),
-                width=1,
-                dash=(),
-            )
-
-            # draw backbone circles at the backbone points (larger for clarity)
-            self.canvas.create_oval(
-                xl - self.circle_r, yl - self.circle_r,
-                xl + self.circle_r, yl + self.circle_r,
-                fill='#FFA726', outline='#CC7600'
-            )
-            self.canvas.create_oval(
-                xr - self.circle_r, yr - self.circle_r,
-                xr + self.circle_r, yr + self.circle_r,
-                fill='#FFA726', outline='#CC7600'
-            )
-
-            # draw base letters near the center (stacked vertically to be readable)
-            label_offset_x = 10
-            self.canvas.create_text(
-                (xl + xr) / 2 - label_offset_x, mid_y,
-                text=left_base, fill=BASE_COLORS[left_base],
-                font=("Helvetica", 12, "bold")
-            )
-            self.canvas.create_text(
-                (xl + xr) / 2 + label_offset_x, mid_y,
-                text=right_base, fill=BASE_COLORS[right_base],
-                font=("Helvetica", 12, "bold")
-            )
+            left_base = self.sequence[i]
+            if left_base != self._drawn_bases[k]:
+                right_base = self._comp_str[i]
+                self.canvas.itemconfig(ids['labels_left'][k], text=left_base, fill=BASE_COLORS[left_base])
+                self.canvas.itemconfig(ids['labels_right'][k], text=right_base, fill=BASE_COLORS[right_base])
+                self._drawn_bases[k] = left_base
 
     def draw(self):
+        # a direct draw satisfies any queued schedule_draw() request
+        self._dirty = False
+        key = (
+            self.view_start, self.view_length, id(self.sequence),
+            self.rung_thickness, self.stripe_count, self.draw_center_accent,
+        ) + self._static_items_key()
+        if key == self._last_key:
+            return
+        self._last_key = key
+
         # compute visible slice indices
         start = max(0, min(self.total_steps - 1, int(self.view_start)))
         end = max(start + 1, min(self.total_steps, start + int(self.view_length)))
-        view_positions = self.positions[start:end]
-
-        # clear canvas and optionally resize height to match view
-        self.canvas.delete("all")
-
-        # Optionally, re-center vertically: compute vertical offset so mid of view is centered in canvas
-        view_top = view_positions[0][0][1] if view_positions else self.top_margin
-        view_bottom = view_positions[-1][0][1] if view_positions else (self.top_margin + self.step_height)
-        view_height = view_bottom - view_top + 2 * self.circle_r
-
-        # compute vertical translation to center the view region in canvas
-        canvas_center_y = self.height / 2
-        view_center_y = (view_top + view_bottom) / 2
-        translate_y = canvas_center_y - view_center_y
-
-        # Draw transformed: we will move coordinates by translate_y
-        # To avoid recomputing positions array, draw everything with shifted y values by translate_y
-        # Use temporary transformed positions
-        transformed = []
-        for (l, r) in view_positions:
-            transformed.append(((l[0], l[1] + translate_y), (r[0], r[1] + translate_y)))
-
-        # draw backbones and rungs using transformed positions
-        # We temporarily replace self.positions for drawing convenience (not changing stored positions)
-        saved_positions = self.positions
-        try:
-            # set positions to transformed for the drawing helpers
-            self.positions = transformed
-            self.draw_backbones(transformed)
-            # draw rungs & bases using slice range mapping [start:end] -> 0..len-1
-            # but we must adjust the slice to the transformed index range
-            # draw_striped_rungs_and_bases expects indices in self.positions, so give 0..len-1
-            self.draw_striped_rungs_and_bases(slice(0, len(transformed)))
-        finally:
-            self.positions = saved_positions
 
-        # draw a central vertical guide (optional, like in your second image)
-        self.canvas.create_line(self.center_x, 0, self.center_x, self.height, fill='#cfcfcf', dash=(3, 6))
+        # backbones and circles for the whole helix are built once per geometry;
+        # a view change only toggles which of them are visible. circle_r and backbone_width
+        # do not move any position, so changing them is picked up here without compute_positions
+        if self._static_items_key() != self._static_key:
+            self._build_static_items()
+        self._show_backbones(start, end)
+        self.draw_striped_rungs_and_bases(slice(start, end))
+
+        # re-center vertically: scroll so the middle of the view is in the middle of the canvas
+        view_center_y = (float(self.pos_y[start]) + float(self.pos_y[end - 1])) / 2
+        window_top = view_center_y - self.height / 2
+        self.canvas.yview_moveto((window_top + SCROLL_EXTENT) / (2 * SCROLL_EXTENT))
+
+    def schedule_draw(self):
+        """Request a redraw; bursts of requests are merged into a single draw() when Tk is idle."""
+        self._dirty = True
+        if not self._draw_pending:
+            self._draw_pending = True
+            self.canvas.after_idle(self._flush_draw)
+
+    def _flush_draw(self):
+        self._draw_pending = False
+        if self._dirty:
+            self.draw()
 
     # Helper controls for paging and randomize
     def page_next(self):
         self.view_start = min(self.total_steps - self.view_length, self.view_start + int(self.view_length))
-        self.draw()
+        self.schedule_draw()
 
     def page_prev(self):
         self.view_start = max(0, self.view_start - int(self.view_length))
-        self.draw()
+        self.schedule_draw()
 
     def set_view(self, start: int = None, length: int = None):
         if start is not None:
             self.view_start = max(0, min(self.total_steps - 1, int(start)))
         if length is not None:
             self.view_length = max(1, min(self.total_steps, int(length)))
-        self.draw()
+        self.schedule_draw()
 
 
 def main():
@@ -305,7 +551,7 @@ def main():
         dna.generate_sequence()
         dna.compute_positions()
         dna.view_start = 0
-        dna.draw()
+        dna.schedule_draw()
 
     rand_btn = tk.Button(controls, text="Randomize sequence", command=randomize)
     rand_btn.pack(fill=tk.X, pady=(12, 2))
@@ -322,7 +568,7 @@ def main():
         dna.view_start = 0
         start_var.set(dna.view_start)
         length_var.set(dna.view_length)
-        dna.draw()
+        dna.schedule_draw()
 
     preset_btn = tk.Button(controls, text="Preset: stacked slices", command=preset_sample)
     preset_btn.pack(fill=tk.X, pady=(12, 2))